@@ -1,8 +1,7 @@
-from typing import Tuple, List, Dict, ClassVar, Type
+from typing import Tuple, List, Dict, ClassVar, Type, Optional
 
 import pandas
 import pandas as pd
-from pydantic import Field
 
 from zerospeech.datasets import AbxLSDataset
 from zerospeech.generics import (
@@ -169,11 +168,15 @@ class AbxLSBenchmark(Benchmark):
     _name: ClassVar[str] = "abxLS"
     _doc_url: ClassVar[str] = "https://zerospeech.com/tasks/task_1/tasks_goals/"
     __submission_cls__: Type[Submission] = AbxLSSubmission
-    dataset: AbxLSDataset = Field(default_factory=lambda: AbxLSDataset.load())
+    # dataset is resolved on first run (AbxLSDataset.load is cached process-wide)
+    dataset: Optional[AbxLSDataset] = None
 
     def run(self, submission: AbxLSSubmission):
         """ run ABX-LSRob tasks """
         params = submission.params
+        if self.dataset is None:
+            self.dataset = AbxLSDataset.load()
+
         self.console.print(f'Running {self.name} benchmark on {submission.location.name}')
         # create output dir
         submission.score_dir.mkdir(exist_ok=True, parents=True)
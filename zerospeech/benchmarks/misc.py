@@ -62,16 +62,21 @@ class BenchmarkList(str, enum.Enum):
         if benchmark_name is None:
             raise InvalidSubmissionError("meta.yaml not found or invalid")
 
-        try:
-            if benchmark_name.startswith("test-"):
-                benchmark_name = benchmark_name.replace("test-", "")
-                bench = cls(benchmark_name)
-                bench.is_test = True
-            else:
-                bench = cls(benchmark_name)
-            return bench
-        except ValueError:
+        is_test = benchmark_name.startswith("test-")
+        if is_test:
+            benchmark_name = benchmark_name.replace("test-", "")
+
+        bench = cls.lookup(benchmark_name)
+        if bench is None:
             raise InvalidBenchmarkError(f"{benchmark_name} is not a valid benchmark !!")
+        if is_test:
+            bench.is_test = True
+        return bench
+
+    @classmethod
+    def lookup(cls, name: str) -> Optional["BenchmarkList"]:
+        """ Find a benchmark by name (returns None if it does not exist) """
+        return cls._value2member_map_.get(name, None)
 
     @property
     def benchmark(self) -> Type[Benchmark]:
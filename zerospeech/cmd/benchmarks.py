@@ -4,10 +4,14 @@ from pathlib import Path
 
 from rich.markdown import Markdown
 
-from zerospeech.benchmarks import BenchmarkList
-from zerospeech.out import error_console, warning_console
-from zerospeech.submissions import show_errors
-from .cli_lib import CMD
+from zerospeech.out import error_console
+from .cli_lib import CMD, lazy_module_getattr, resolve_benchmark_or_exit
+
+# benchmark & submission modules are only imported when a command uses them
+__getattr__ = lazy_module_getattr(globals(), {
+    "BenchmarkList": "zerospeech.benchmarks",
+    "show_errors": "zerospeech.submissions",
+})
 
 
 class BenchmarksCMD(CMD):
@@ -21,6 +25,8 @@ class BenchmarksCMD(CMD):
 
     # noinspection PyUnresolvedReferences
     def run(self, argv: argparse.Namespace):
+        from zerospeech.benchmarks import BenchmarkList
+
         markdown_text = """#### List of Benchmarks\n\n"""
         for nb, bench in enumerate(BenchmarkList):
             markdown_text += f"{nb + 1}) **{bench.value}**\n\n"
@@ -45,12 +51,9 @@ class BenchmarkRunCMD(CMD):
                             help="Do not print information to stdout")
 
     def run(self, argv: argparse.Namespace):
-        try:
-            benchmark_type = BenchmarkList(argv.name)
-        except ValueError:
-            error_console.log(f"Specified benchmark ({argv.name}) does not exist !!!!")
-            warning_console.log(f"Use one of the following : {','.join(b for b in BenchmarkList)}")
-            sys.exit(1)
+        from zerospeech.submissions import show_errors
+
+        benchmark_type = resolve_benchmark_or_exit(argv.name)
 
         # Load benchmark
         benchmark = benchmark_type.benchmark(quiet=argv.quiet)
@@ -64,10 +67,11 @@ class BenchmarkRunCMD(CMD):
             sys.exit(1)
 
         load_args = {}
-        if 'all' not in argv.sets and len(argv.sets) > 0:
+        selected_sets, selected_tasks = frozenset(argv.sets), frozenset(argv.tasks)
+        if selected_sets and 'all' not in selected_sets:
             load_args['sets'] = argv.sets
 
-        if 'all' not in argv.tasks and len(argv.sets) > 0:
+        if selected_tasks and 'all' not in selected_tasks:
             load_args['tasks'] = argv.tasks
 
         submission = benchmark.load_submission(location=sub_dir, **load_args)
@@ -101,12 +105,7 @@ class BenchmarksInfoCMD(CMD):
         parser.add_argument("name")
 
     def run(self, argv: argparse.Namespace):
-        try:
-            bench = BenchmarkList(argv.name)
-        except ValueError:
-            error_console.log(f"Specified benchmark ({argv.name}) does not exist !!!!")
-            warning_console.log(f"Use one of the following : {','.join(b for b in BenchmarkList)}")
-            sys.exit(1)
+        bench = resolve_benchmark_or_exit(argv.name)
 
         # print benchmark documentation
         self.console.print(bench.benchmark.docs())
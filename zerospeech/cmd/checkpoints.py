@@ -2,17 +2,8 @@ import argparse
 import sys
 from pathlib import Path
 
-from rich.padding import Padding
-from rich.table import Table
-
-from zerospeech.generics import checkpoints
-from zerospeech.misc import md5sum, extract
-from zerospeech.networkio import check_update_repo_index, update_repo_index
 from zerospeech.out import console, error_console, void_console, warning_console
-from zerospeech.settings import get_settings
-from .cli_lib import CMD
-
-st = get_settings()
+from .cli_lib import CMD, print_repo_items
 
 
 class CheckpointsCMD(CMD):
@@ -24,32 +15,10 @@ class CheckpointsCMD(CMD):
         parser.add_argument("--local", action="store_true", help="List local checkpoint only")
 
     def run(self, argv: argparse.Namespace):
-        checkpoints_dir = checkpoints.CheckpointDir.load()
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Name")
-        table.add_column("Origin")
-        table.add_column("Size")
-        table.add_column("Installed")
-
-        if argv.local:
-            dt_list = checkpoints_dir.items
-        else:
-            dt_list = checkpoints_dir.available_items
-
-        for d in dt_list:
-            dts = checkpoints_dir.get(d)
-            if dts.origin.type == 'internal':
-                host = st.repo_origin.host
-            else:
-                host = "external"
+        from zerospeech.generics import checkpoints
 
-            table.add_row(
-                dts.name, host, dts.origin.size_label, f"{dts.installed}"
-            )
-
-        console.print(
-            Padding(f"==> RootDir: {checkpoints_dir.root_dir}", (1, 0, 1, 0), style="bold grey70", expand=False))
-        console.print(table)
+        checkpoints_dir = checkpoints.CheckpointDir.load()
+        print_repo_items(checkpoints_dir.root_dir, checkpoints_dir.iter_items(local_only=argv.local))
 
 
 class PullCheckpointCMD(CMD):
@@ -63,6 +32,9 @@ class PullCheckpointCMD(CMD):
         parser.add_argument('-q', '--quiet', action='store_true', help='Suppress download info output')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.generics import checkpoints
+        from zerospeech.networkio import check_update_repo_index, update_repo_index
+
         # update repo index if necessary
         if check_update_repo_index():
             update_repo_index()
@@ -85,6 +57,10 @@ class ImportCheckpointCMD(CMD):
                             help='Suppress download info output')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.generics import checkpoints
+        from zerospeech.misc import md5sum, extract
+        from zerospeech.networkio import check_update_repo_index, update_repo_index
+
         # update repo index if necessary
         if check_update_repo_index():
             update_repo_index()
@@ -127,6 +103,8 @@ class RemoveCheckpointCMD(CMD):
         parser.add_argument('name')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.generics import checkpoints
+
         checkpoints_dir = checkpoints.CheckpointDir.load()
         cpt = checkpoints_dir.get(argv.name)
         if cpt:
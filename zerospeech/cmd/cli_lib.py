@@ -1,18 +1,99 @@
 import abc
 import argparse
+import functools
+import importlib
 import sys
 import uuid
 from collections import namedtuple
-from typing import Optional, Type
+from pathlib import Path
+from typing import Optional, Type, Dict, Callable, Any, Iterable, TYPE_CHECKING
 
 from treelib import Tree, Node
 
-from zerospeech.out import console, void_console
+from zerospeech.out import console, void_console, error_console, warning_console
+from zerospeech.settings import get_settings
+
+if TYPE_CHECKING:
+    from zerospeech.benchmarks import BenchmarkList
+    from zerospeech.generics import OriginItem
 
 NAMESPACE_SEP = ":"
 LIST_OF_COMMANDS = []
 
 
+def lazy_module_getattr(module_globals: Dict[str, Any], imports: Dict[str, str]) -> Callable[[str], Any]:
+    """ Build a module level __getattr__ (PEP 562) that imports the given names on first access
+
+    :param module_globals: globals() of the module, resolved names are cached in it
+    :param imports: mapping of attribute name to the module it is imported from
+    """
+
+    def __getattr__(name: str):
+        if name not in imports:
+            raise AttributeError(f"module {module_globals['__name__']!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(imports[name]), name)
+        module_globals[name] = value
+        return value
+
+    return __getattr__
+
+
+@functools.lru_cache(maxsize=None)
+def benchmark_names(sep: str = ',') -> str:
+    """ Names of all available benchmarks joined by sep (computed once) """
+    from zerospeech.benchmarks import BenchmarkList
+    return sep.join(b.value for b in BenchmarkList)
+
+
+def resolve_benchmark_or_exit(name: str) -> "BenchmarkList":
+    """ Find a benchmark by its name, exit with an error message if it does not exist """
+    from zerospeech.benchmarks import BenchmarkList
+
+    bench = BenchmarkList.lookup(name)
+    if bench is None:
+        error_console.log(f"Specified benchmark ({name}) does not exist !!!!")
+        warning_console.log(f"Use one of the following : {benchmark_names()}")
+        sys.exit(1)
+    return bench
+
+
+def print_repo_items(root_dir: Path, items: Iterable["OriginItem"]):
+    """ Print a listing of repository items
+
+    When stdout is not a terminal, items are printed as plain tab separated rows
+    (name, origin, size, installed) that are easy to parse with other tools.
+    """
+    st = get_settings()
+    rows = (
+        (
+            item.origin.name,
+            st.repo_origin.host if item.origin.type == 'internal' else "external",
+            item.origin.size_label,
+            f"{item.installed}"
+        )
+        for item in items
+    )
+
+    if not console.is_terminal:
+        for row in rows:
+            print("\t".join(row))
+        return
+
+    from rich.padding import Padding
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Name")
+    table.add_column("Origin")
+    table.add_column("Size")
+    table.add_column("Installed")
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(Padding(f"==> RootDir: {root_dir}", (1, 0, 1, 0), style="bold grey70", expand=False))
+    console.print(table)
+
+
 class CMD(abc.ABC):
     COMMAND = "<cmd_name>"
     NAMESPACE = "<cmd-path>"
@@ -21,21 +102,29 @@ class CMD(abc.ABC):
     def __init__(self, root):
         self._unique_id = f"{uuid.uuid4()}"
         self.__check_presets__()
+        self._root = root
+        self._epilog = None
 
+    @functools.cached_property
+    def parser(self) -> argparse.ArgumentParser:
+        """ Argument parser of the command (only built when the command is invoked) """
+        root = self._root
         prog = f"{root} {self.NAMESPACE}{NAMESPACE_SEP}{self.COMMAND}"
         if self.NAMESPACE == '':
             prog = f"{root} {self.COMMAND}"
 
-        self.parser = argparse.ArgumentParser(
+        parser = argparse.ArgumentParser(
             prog=prog,
             usage=f"{prog}[{NAMESPACE_SEP}subcommand] [<args>]",
-            formatter_class=argparse.RawTextHelpFormatter
+            formatter_class=argparse.RawTextHelpFormatter,
+            epilog=self._epilog
         )
         # load description
         if self.long_description:
-            self.parser.description = self.long_description
+            parser.description = self.long_description
         else:
-            self.parser.description = self.short_description
+            parser.description = self.short_description
+        return parser
 
     @classmethod
     def __init_subclass__(cls, /, **kwargs):
@@ -67,8 +156,10 @@ class CMD(abc.ABC):
         return f"{self.COMMAND}:\t{self.short_description}"
 
     def add_epilog(self, child_info):
-        # todo check if this works
-        self.parser.epilog = child_info
+        self._epilog = child_info
+        # update parser if it was already built
+        if 'parser' in self.__dict__:
+            self.parser.epilog = child_info
 
     @property
     def name(self) -> str:
@@ -162,18 +253,22 @@ class CommandTree:
         else:
             return self.__cmd_tree.show(data_property="label", stdout=False)
 
+    def build_epilog(self, node: Node):
+        """ Append the list of sub-commands of a node to its help message """
+        if node.identifier == 0:
+            return
+        if not self.has_children(node.identifier):
+            return
+
+        epilog = "---\n" \
+                 "list of available sub-commands : \n\n" \
+                 f"{self.show(root=node.identifier)}"
+        node.data.add_epilog(epilog)
+
     def build_epilogs(self):
         """ Iterate over all nodes and append epilog to help message"""
         for node in self.__cmd_tree.all_nodes():
-            if node.identifier == 0:
-                continue
-            if not self.has_children(node.identifier):
-                continue
-
-            epilog = "---\n" \
-                     "list of available sub-commands : \n\n" \
-                     f"{self.show(root=node.identifier)}"
-            node.data.add_epilog(epilog)
+            self.build_epilog(node)
 
     def get_all_paths(self):
         paths_as_list = []
@@ -207,29 +302,36 @@ class CLI:
         :param usage:
         """
         self.cmd_tree = cmd_tree
-        # Build the tree epilogs
-        self.cmd_tree.build_epilogs()
-
-        # Help epilog
-        epilog = "---\n" \
-                 "list of available commands : \n\n" \
-                 f"{cmd_tree.show()}"
-
+        # epilogs (rendering of the command tree) are only built when a help message can be shown
         self.parser = argparse.ArgumentParser(
             description=description,
             usage=usage,
-            epilog=epilog,
             formatter_class=argparse.RawTextHelpFormatter
         )
         self.parser.add_argument('command', help='Subcommand to run')
 
+    @property
+    def epilog(self) -> str:
+        """ Help epilog listing all available commands """
+        return "---\n" \
+               "list of available commands : \n\n" \
+               f"{self.cmd_tree.show()}"
+
+    def print_help(self):
+        """ Print the help message of the root command """
+        self.parser.epilog = self.epilog
+        self.parser.print_help()
+
     def run(self):
         """ Run the Command Line Interface """
+        if self.cmd_tree.is_help_cmd(next(iter(sys.argv[1:2]), None)):
+            # help flags are handled by argparse itself
+            self.parser.epilog = self.epilog
         args = self.parser.parse_args(sys.argv[1:2])
 
         # check if help is asked
         if self.cmd_tree.is_help_cmd(args.command):
-            self.parser.print_help()
+            self.print_help()
             sys.exit(0)
 
         # check if requesting cmd list for autocomplete
@@ -245,14 +347,17 @@ class CLI:
         cmd_node = self.cmd_tree.find_cmd(args.command)
         if cmd_node is None or cmd_node.identifier == 0:
             print(f'Unrecognized command {args.command}\n', file=sys.stderr)
-            self.parser.print_help()
+            self.print_help()
             sys.exit(1)
 
         cmd = cmd_node.data
         if not isinstance(cmd, CMD):
             print(f'Unrecognized command {args.command}\n', file=sys.stderr)
-            self.parser.print_help()
+            self.print_help()
             sys.exit(2)
 
+        # only the invoked command lists its sub-commands
+        self.cmd_tree.build_epilog(cmd_node)
+
         # call sub-command
         cmd.run_cmd(argv=sys.argv[2:])
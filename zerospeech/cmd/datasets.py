@@ -2,17 +2,8 @@ import argparse
 import sys
 from pathlib import Path
 
-from rich.padding import Padding
-from rich.table import Table
-
-from zerospeech.datasets import DatasetsDir, Dataset
-from zerospeech.misc import md5sum, extract
-from zerospeech.networkio import check_update_repo_index, update_repo_index
 from zerospeech.out import console, error_console, warning_console, void_console
-from zerospeech.settings import get_settings
-from .cli_lib import CMD
-
-st = get_settings()
+from .cli_lib import CMD, print_repo_items
 
 
 class DatasetCMD(CMD):
@@ -24,32 +15,11 @@ class DatasetCMD(CMD):
         parser.add_argument("--local", action="store_true", help="List local datasets only")
 
     def run(self, argv: argparse.Namespace):
-        datasets_dir = DatasetsDir.load()
-
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Name")
-        table.add_column("Origin")
-        table.add_column("Size")
-        table.add_column("Installed")
-
-        if argv.local:
-            dt_list = datasets_dir.items
-        else:
-            dt_list = datasets_dir.available_items
+        from zerospeech.datasets import DatasetsDir
 
-        for d in dt_list:
-            dts = datasets_dir.get(d)
-            if dts.origin.type == 'internal':
-                host = st.repo_origin.host
-            else:
-                host = "external"
-
-            table.add_row(
-                dts.origin.name, host, dts.origin.size_label, f"{dts.installed}"
-            )
+        datasets_dir = DatasetsDir.load()
 
-        console.print(Padding(f"==> RootDir: {datasets_dir.root_dir}", (1, 0, 1, 0), style="bold grey70", expand=False))
-        console.print(table)
+        print_repo_items(datasets_dir.root_dir, datasets_dir.iter_items(local_only=argv.local))
 
 
 class PullDatasetCMD(CMD):
@@ -63,6 +33,9 @@ class PullDatasetCMD(CMD):
         parser.add_argument('-q', '--quiet', action='store_true', help='Suppress download info output')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.datasets import DatasetsDir, Dataset
+        from zerospeech.networkio import check_update_repo_index, update_repo_index
+
         # update repo index if necessary
         if check_update_repo_index():
             update_repo_index()
@@ -85,6 +58,9 @@ class ImportDatasetCMD(CMD):
                             help='Suppress download info output')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.datasets import DatasetsDir
+        from zerospeech.misc import md5sum, extract
+
         datasets_dir = DatasetsDir.load()
         archive = Path(argv.zip_file)
         std_out = console
@@ -125,6 +101,8 @@ class RemoveDatasetCMD(CMD):
         parser.add_argument('name')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.datasets import DatasetsDir
+
         dataset_dir = DatasetsDir.load()
         dts = dataset_dir.get(argv.name)
         if dts:
@@ -2,17 +2,8 @@ import argparse
 import sys
 from pathlib import Path
 
-from rich.padding import Padding
-from rich.table import Table
-
-from zerospeech.generics import samples
-from zerospeech.misc import md5sum, extract
-from zerospeech.networkio import check_update_repo_index, update_repo_index
 from zerospeech.out import console, error_console, void_console, warning_console
-from zerospeech.settings import get_settings
-from .cli_lib import CMD
-
-st = get_settings()
+from .cli_lib import CMD, print_repo_items
 
 
 class SamplesCMD(CMD):
@@ -24,32 +15,11 @@ class SamplesCMD(CMD):
         parser.add_argument("--local", action="store_true", help="List local checkpoint only")
 
     def run(self, argv: argparse.Namespace):
-        samples_dir = samples.SamplesDir.load()
-
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Name")
-        table.add_column("Origin")
-        table.add_column("Size")
-        table.add_column("Installed")
-
-        if argv.local:
-            dt_list = samples_dir.items
-        else:
-            dt_list = samples_dir.available_items
+        from zerospeech.generics import samples
 
-        for d in dt_list:
-            dts = samples_dir.get(d)
-            if dts.origin.type == 'internal':
-                host = st.repo_origin.host
-            else:
-                host = "external"
-
-            table.add_row(
-                dts.name, host, dts.origin.size_label, f"{dts.installed}"
-            )
+        samples_dir = samples.SamplesDir.load()
 
-        console.print(Padding(f"==> RootDir: {samples_dir.root_dir}", (1, 0, 1, 0), style="bold grey70", expand=False))
-        console.print(table)
+        print_repo_items(samples_dir.root_dir, samples_dir.iter_items(local_only=argv.local))
 
 
 class PullSampleCMD(CMD):
@@ -63,6 +33,9 @@ class PullSampleCMD(CMD):
         parser.add_argument('-q', '--quiet', action='store_true', help='Suppress download info output')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.generics import samples
+        from zerospeech.networkio import check_update_repo_index, update_repo_index
+
         # update repo index if necessary
         if check_update_repo_index():
             update_repo_index()
@@ -85,6 +58,10 @@ class ImportSamples(CMD):
                             help='Suppress download info output')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.generics import samples
+        from zerospeech.misc import md5sum, extract
+        from zerospeech.networkio import check_update_repo_index, update_repo_index
+
         # update repo index if necessary
         if check_update_repo_index():
             update_repo_index()
@@ -129,6 +106,8 @@ class RemoveSampleCMD(CMD):
         parser.add_argument('name')
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.generics import samples
+
         sample_dir = samples.SamplesDir.load()
         smp = sample_dir.get(argv.name)
         if smp:
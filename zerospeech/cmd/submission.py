@@ -2,11 +2,16 @@ import argparse
 import sys
 from pathlib import Path
 
-from zerospeech.benchmarks import BenchmarkList
-from zerospeech.out import error_console, warning_console, console as std_console
-from zerospeech.submissions import MetaFile, show_errors
-from zerospeech.tasks import BenchmarkParameters
-from .cli_lib import CMD
+from zerospeech.out import error_console, console as std_console
+from .cli_lib import CMD, lazy_module_getattr, resolve_benchmark_or_exit
+
+# benchmark, submission & task modules are only imported when a command uses them
+__getattr__ = lazy_module_getattr(globals(), {
+    "BenchmarkList": "zerospeech.benchmarks",
+    "MetaFile": "zerospeech.submissions",
+    "show_errors": "zerospeech.submissions",
+    "BenchmarkParameters": "zerospeech.tasks",
+})
 
 
 class Submission(CMD):
@@ -32,12 +37,7 @@ class SubmissionInit(CMD):
         parser.add_argument("location")
 
     def run(self, argv: argparse.Namespace):
-        try:
-            benchmark_type = BenchmarkList(argv.name)
-        except ValueError:
-            error_console.log(f"Specified benchmark ({argv.name}) does not exist !!!!")
-            warning_console.log(f"Use one of the following : {','.join(b for b in BenchmarkList)}")
-            sys.exit(1)
+        benchmark_type = resolve_benchmark_or_exit(argv.name)
 
         # Load benchmark
         benchmark = benchmark_type.benchmark()
@@ -63,26 +63,24 @@ class BenchmarkParamsCMD(CMD):
         parser.add_argument('-r', '--reset', action="store_true", help="Reset params.yaml to default values")
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.submissions import MetaFile
+        from zerospeech.tasks import BenchmarkParameters
+
         location = Path(argv.submission_dir)
         if not location.is_dir():
-            error_console("Location specified does not exist !!!")
+            error_console.log("Location specified does not exist !!!")
             sys.exit(2)
 
-        benchmark_name = None
         try:
             benchmark_name = MetaFile.benchmark_from_submission(location)
             if benchmark_name is None:
                 raise TypeError("benchmark not found")
-
-            benchmark_type = BenchmarkList(benchmark_name)
         except TypeError:
             error_console.log(f"Specified submission does not have a valid {MetaFile.file_stem}"
                               f"\nCannot find benchmark type")
             sys.exit(1)
-        except ValueError:
-            error_console.log(f"Specified benchmark ({benchmark_name}) does not exist !!!!")
-            warning_console.log(f"Use one of the following : {','.join(b for b in BenchmarkList)}")
-            sys.exit(1)
+
+        benchmark_type = resolve_benchmark_or_exit(benchmark_name)
 
         # Load benchmark
         benchmark = benchmark_type.benchmark(quiet=argv.quiet)
@@ -105,37 +103,36 @@ class SubmissionVerify(CMD):
 
     def init_parser(self, parser: argparse.ArgumentParser):
         parser.add_argument("location")
+        parser.add_argument('-q', '--quiet', action='store_true', default=False,
+                            help="Do not print information to stdout")
 
     def run(self, argv: argparse.Namespace):
+        from zerospeech.submissions import MetaFile, show_errors
+
         location = Path(argv.location)
         if not location.is_dir():
-            error_console("Location specified does not exist !!!")
+            error_console.log("Location specified does not exist !!!")
             sys.exit(2)
 
-        benchmark_name = None
         try:
             benchmark_name = MetaFile.benchmark_from_submission(location)
             if benchmark_name is None:
                 raise TypeError("benchmark not found")
-
-            benchmark_type = BenchmarkList(benchmark_name)
         except TypeError:
             error_console.log(f"Specified submission does not have a valid {MetaFile.file_stem}"
                               f"\nCannot find benchmark type")
             sys.exit(1)
-        except ValueError:
-            error_console.log(f"Specified benchmark ({benchmark_name}) does not exist !!!!")
-            warning_console.log(f"Use one of the following : {','.join(b for b in BenchmarkList)}")
-            sys.exit(1)
+
+        benchmark_type = resolve_benchmark_or_exit(benchmark_name)
 
         # Load benchmark
         benchmark = benchmark_type.benchmark(quiet=argv.quiet)
         submission = benchmark.load_submission(location)
         with std_console.status(f"Validating submission @ {location}"):
-            _ = submission.valid
+            is_valid = submission.valid
 
-        if submission.valid:
-            std_console.print(f"Submission @ {location} is a valid submission for {bench} :heavy_check_mark:",
-                              style='bold green')
+        if is_valid:
+            std_console.print(f"Submission @ {location} is a valid submission for {benchmark_name} "
+                              f":heavy_check_mark:", style='bold green')
         else:
             show_errors(submission.validation_output)
@@ -4,8 +4,14 @@ from pathlib import Path
 
 from zerospeech.out import error_console, console as std_console
 from zerospeech.settings import get_settings
-from zerospeech.upload import SubmissionUploader, APIHTTPException, BenchmarkClosedError
-from .cli_lib import CMD
+from .cli_lib import CMD, lazy_module_getattr
+
+# the upload module is only imported when a command uses it
+__getattr__ = lazy_module_getattr(globals(), {
+    "SubmissionUploader": "zerospeech.upload",
+    "APIHTTPException": "zerospeech.upload",
+    "BenchmarkClosedError": "zerospeech.upload",
+})
 
 st = get_settings()
 
@@ -29,6 +35,8 @@ class SubmitOnline(CMD):
         std_console.print("Feature Not Yet Available !!!", style="red bold")
 
     def _run(self, argv: argparse.Namespace):
+        from zerospeech.upload import SubmissionUploader, APIHTTPException, BenchmarkClosedError
+
         try:
             if argv.resume:
                 uploader = SubmissionUploader.resume(Path(argv.submission_dir), quiet=argv.quiet)
@@ -4,9 +4,11 @@ import sys
 from rich.prompt import Confirm
 from rich.table import Table
 
-from .cli_lib import CMD
-from ..out import console as std_console, error_console, warning_console
-from zerospeech.upload import CurrentUser
+from .cli_lib import CMD, lazy_module_getattr
+from ..out import console as std_console, error_console, warning_console, as_console
+
+# the upload module is only imported when a command uses it
+__getattr__ = lazy_module_getattr(globals(), {"CurrentUser": "zerospeech.upload"})
 
 
 class User(CMD):
@@ -22,6 +24,8 @@ class User(CMD):
         std_console.print("Feature Not Yet Available !!!", style="red bold")
 
     def _run(self, argv: argparse.Namespace):
+        from zerospeech.upload import CurrentUser
+
         current = CurrentUser.load()
         if current is None:
             error_console.print("No current user session, please use login to create a session !")
@@ -52,6 +56,8 @@ class UserLogin(CMD):
         std_console.print("Feature Not Yet Available !!!", style="red bold")
 
     def _run(self, argv: argparse.Namespace):
+        from zerospeech.upload import CurrentUser
+
         if CurrentUser.session_file.is_file():
             CurrentUser.clear()
         try:
@@ -71,5 +77,7 @@ class UserClear(CMD):
         pass
 
     def run(self, argv: argparse.Namespace):
-        if Confirm("Are you sure you want to clear the current session ?", console=warning_console):
+        from zerospeech.upload import CurrentUser
+
+        if Confirm("Are you sure you want to clear the current session ?", console=as_console(warning_console)):
             CurrentUser.clear()
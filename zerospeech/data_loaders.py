@@ -1,6 +1,10 @@
+import collections
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Any, Union, Protocol, Tuple, List
-from zipfile import ZipFile
+from typing import Callable, Any, Union, Protocol, Tuple, List, Optional
+from zipfile import ZipFile, ZipInfo, ZIP_STORED
 
 import numpy
 import numpy as np
@@ -10,6 +14,23 @@ from .generics import FileItem, FileTypes
 
 FileLoaderType = Callable[[FileItem], Any]
 
+# files bigger than this are not read ahead in memory when zipping
+_ZIP_READ_AHEAD_MAX_SIZE = 64 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def csv_engine() -> str:
+    """ Use the multithreaded pyarrow csv parser when available
+
+    pyarrow is only imported on the first call, commands that do not read csv files
+    do not pay for its import.
+    """
+    try:
+        import pyarrow  # noqa: is not a strict requirement
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
 
 class FileError(Exception):
     """ Error while accessing file data """
@@ -49,9 +70,45 @@ class Zippable(Protocol):
         pass
 
 
-def zip_zippable(item: Zippable, archive_file: Path = Path("archive.zip")):
-    """ Create a zip archive from an item that uses the Zippable protocol"""
+def zip_zippable(
+        item: Zippable, archive_file: Path = Path("archive.zip"), *,
+        compression: int = ZIP_STORED, compresslevel: Optional[int] = None, read_ahead: int = 4
+):
+    """ Create a zip archive from an item that uses the Zippable protocol
+
+    Files are read ahead by a small pool of threads while the archive is being written,
+    large files are streamed directly into the archive.
+
+    :param item: the item to archive
+    :param archive_file: location of the created archive
+    :param compression: zipfile compression method (defaults to no compression)
+    :param compresslevel: level of compression (if supported by the method)
+    :param read_ahead: number of files to read ahead of the writer
+    """
     items_list = item.__zippable__()
-    with ZipFile(archive_file, 'w') as zip_obj:
-        for dir_name, filename in items_list:
-            zip_obj.write(filename, f"{dir_name}{filename.name}")
+
+    def _read(entry: Tuple[str, Path]) -> Tuple[str, Path, Optional[bytes]]:
+        dir_name, filename = entry
+        if filename.stat().st_size > _ZIP_READ_AHEAD_MAX_SIZE:
+            return dir_name, filename, None
+        return dir_name, filename, filename.read_bytes()
+
+    with ZipFile(archive_file, 'w', compression=compression, compresslevel=compresslevel) as zip_obj, \
+            ThreadPoolExecutor(max_workers=read_ahead) as pool:
+        pending = collections.deque()
+        entries = iter(items_list)
+        for entry in itertools.islice(entries, read_ahead):
+            pending.append(pool.submit(_read, entry))
+
+        while pending:
+            dir_name, filename, data = pending.popleft().result()
+            # keep the queue full while this file is written
+            for entry in itertools.islice(entries, 1):
+                pending.append(pool.submit(_read, entry))
+
+            arc_name = f"{dir_name}{filename.name}"
+            if data is None:
+                zip_obj.write(filename, arc_name)
+            else:
+                zip_obj.writestr(ZipInfo.from_file(filename, arc_name), data,
+                                 compress_type=compression, compresslevel=compresslevel)
@@ -1,3 +1,4 @@
+import functools
 import json
 from pathlib import Path
 from typing import Optional, TypeVar, ClassVar, Type, Union
@@ -5,7 +6,7 @@ from typing import Optional, TypeVar, ClassVar, Type, Union
 from pydantic import BaseModel, validator
 
 from zerospeech.generics import (
-    RepoItemDir, ImportableItem, DownloadableItem, Namespace, Subset
+    RepoItemDir, ImportableItem, DownloadableItem, Namespace, Subset, load_repo_dir
 )
 from zerospeech.misc import extract, download_extract_archive
 from zerospeech.out import console
@@ -100,4 +101,27 @@ class DatasetsDir(RepoItemDir):
 
     @classmethod
     def load(cls):
-        return cls(root_dir=st.dataset_path)
+        return load_repo_dir(cls, st.dataset_path)
+
+
+@functools.lru_cache(maxsize=None)
+def load_dataset(dataset_cls: Type[Dataset], load_index: bool = True) -> Dataset:
+    """ Load a dataset from the dir registry
+
+    Results are cached on (dataset_cls, load_index), positional & keyword calls of
+    the Dataset.load classmethods resolve to the same cache entry.
+    """
+    dataset = DatasetsDir.load().get(dataset_cls.__dataset_name__, cls=dataset_cls)
+
+    if dataset is None:
+        raise DatasetNotFoundError(f"The {dataset_cls.__dataset_name__} does not exist")
+
+    if not dataset.installed:
+        raise DatasetNotInstalledError(f"The {dataset_cls.__dataset_name__} is not installed locally")
+
+    if load_index:
+        dataset.load_index()
+        # convert all paths to absolute paths
+        dataset.index.make_absolute()
+
+    return dataset
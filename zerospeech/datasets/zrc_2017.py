@@ -1,7 +1,6 @@
-import functools
 from typing import Optional, ClassVar
 
-from ._model import Dataset, DatasetNotFoundError, DatasetsDir, DatasetNotInstalledError
+from ._model import Dataset, load_dataset
 
 
 class ZRC2017Dataset(Dataset):
@@ -9,20 +8,6 @@ class ZRC2017Dataset(Dataset):
     __dataset_name__: ClassVar[str] = "zrc2017-test-dataset"
 
     @classmethod
-    @functools.lru_cache
     def load(cls, load_index: bool = True) -> Optional["ZRC2017Dataset"]:
         """ Loads the dataset """
-        dataset = DatasetsDir.load().get(cls.__dataset_name__, cls=cls)
-
-        if dataset is None:
-            raise DatasetNotFoundError(f"The {cls.__dataset_name__} does not exist")
-
-        if not dataset.installed:
-            raise DatasetNotInstalledError(f"The {cls.__dataset_name__} is not installed locally")
-
-        if load_index:
-            dataset.load_index()
-            # convert all paths to absolute paths
-            dataset.index.make_absolute()
-
-        return dataset
+        return load_dataset(cls, load_index)
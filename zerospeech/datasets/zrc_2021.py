@@ -1,7 +1,6 @@
-import functools
 from typing import Optional, ClassVar
 
-from ._model import Dataset, DatasetNotFoundError, DatasetsDir, DatasetNotInstalledError
+from ._model import Dataset, load_dataset
 
 
 class SLM21Dataset(Dataset):
@@ -9,23 +8,9 @@ class SLM21Dataset(Dataset):
     __dataset_name__: ClassVar[str] = "sLM21-dataset"
 
     @classmethod
-    @functools.lru_cache
     def load(cls, load_index: bool = True) -> Optional["SLM21Dataset"]:
         """ Load dataset from dir registry """
-        dataset = DatasetsDir.load().get(cls.__dataset_name__, cls)
-
-        if dataset is None:
-            raise DatasetNotFoundError("The sLM21-dataset does not exist")
-
-        if not dataset.installed:
-            raise DatasetNotInstalledError("The sLM21-dataset is not installed locally")
-
-        if load_index:
-            dataset.load_index()
-            # convert all paths to absolute paths
-            dataset.index.make_absolute()
-
-        return dataset
+        return load_dataset(cls, load_index)
 
 
 class AbxLSDataset(Dataset):
@@ -33,23 +18,9 @@ class AbxLSDataset(Dataset):
     __dataset_name__: ClassVar[str] = "abxLS-dataset"
 
     @classmethod
-    @functools.lru_cache
     def load(cls, load_index: bool = True) -> Optional["AbxLSDataset"]:
         """ Load """
-        dataset = DatasetsDir.load().get(cls.__dataset_name__, cls=cls)
-
-        if dataset is None:
-            raise DatasetNotFoundError(f"The {cls.__dataset_name__} does not exist")
-
-        if not dataset.installed:
-            raise DatasetNotInstalledError(f"The {cls.__dataset_name__} is not installed locally")
-
-        if load_index:
-            dataset.load_index()
-            # convert all paths to absolute paths
-            dataset.index.make_absolute()
-
-        return dataset
+        return load_dataset(cls, load_index)
 
 
 class ProsAuditLMDataset(Dataset):
@@ -57,19 +28,5 @@ class ProsAuditLMDataset(Dataset):
     __dataset_name__: ClassVar[str] = "prosaudit-dataset"
 
     @classmethod
-    @functools.lru_cache
     def load(cls, load_index: bool = True) -> Optional["ProsAuditLMDataset"]:
-        dataset = DatasetsDir.load().get(cls.__dataset_name__, cls=cls)
-
-        if dataset is None:
-            raise DatasetNotFoundError(f"The {cls.__dataset_name__} does not exist")
-
-        if not dataset.installed:
-            raise DatasetNotInstalledError(f"The {cls.__dataset_name__} is not installed locally")
-
-        if load_index:
-            dataset.load_index()
-            # convert all paths to absolute paths
-            dataset.index.make_absolute()
-
-        return dataset
+        return load_dataset(cls, load_index)
@@ -1,10 +1,11 @@
 import abc
 import functools
 import json
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Type, ClassVar, Literal, Union, Tuple, Dict, Any
+from typing import List, Optional, Type, ClassVar, Literal, Union, Tuple, Dict, Any, Iterator
 
 from pydantic import BaseModel, AnyHttpUrl, validator, parse_obj_as, DirectoryPath, ByteSize, root_validator
 
@@ -164,7 +165,9 @@ class RepoItemDir(BaseModel, abc.ABC):
     @property
     def items(self) -> List[str]:
         """ Returns a list of installed items """
-        return [d.name for d in self.root_dir.iterdir() if d.is_dir()]
+        # scandir entries carry their type, avoiding a stat call per entry
+        with os.scandir(self.root_dir) as it:
+            return [d.name for d in it if d.is_dir()]
 
     @property
     def available_items(self) -> List[str]:
@@ -172,6 +175,19 @@ class RepoItemDir(BaseModel, abc.ABC):
         item_list: List[RepositoryItem] = getattr(index, self.item_type.key_name, [])
         return [d.name for d in item_list]
 
+    def iter_items(self, local_only: bool = False) -> Iterator[DownloadableItem]:
+        """ Iterate over the items of the repository index (in a single pass)
+
+        :param local_only: only return items that are installed locally
+        """
+        index = RepositoryIndex.load()
+        item_list: List[RepositoryItem] = getattr(index, self.item_type.key_name, [])
+        installed = frozenset(self.items) if local_only else None
+        for d in item_list:
+            if installed is not None and d.name not in installed:
+                continue
+            yield self.item_type(location=self.root_dir / d.name, origin=d)
+
     def find_by_hash(self, hash_code: str) -> Optional[RepositoryItem]:
         index = RepositoryIndex.load()
         item_list: List[RepositoryItem] = getattr(index, self.item_type.key_name, [])
@@ -198,3 +214,13 @@ class RepoItemDir(BaseModel, abc.ABC):
         if cls is None:
             return self.item_type(location=loc, origin=repo)
         return cls(location=loc, origin=repo)
+
+
+@functools.lru_cache(maxsize=None)
+def load_repo_dir(dir_cls: Type[RepoItemDir], root_dir: Path) -> RepoItemDir:
+    """ Load a directory manager of repository items
+
+    Results are cached on (dir_cls, root_dir), managers only hold their location & read
+    the (cached) repository index on demand so they never go stale.
+    """
+    return dir_cls(root_dir=root_dir)
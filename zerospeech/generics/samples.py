@@ -3,7 +3,7 @@ from typing import ClassVar, Type
 from zerospeech.misc import download_extract_archive
 from zerospeech.out import console
 from zerospeech.settings import get_settings
-from .repository import DownloadableItem, RepositoryItemType, RepoItemDir
+from .repository import load_repo_dir, DownloadableItem, RepositoryItemType, RepoItemDir
 
 st = get_settings()
 
@@ -29,4 +29,4 @@ class SamplesDir(RepoItemDir):
 
     @classmethod
     def load(cls):
-        return cls(root_dir=st.samples_path)
+        return load_repo_dir(cls, st.samples_path)
@@ -1,9 +1,22 @@
 """ Wrapper around HTTP requests """
+import functools
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from zerospeech.out import console
 
 
+@functools.lru_cache(maxsize=None)
+def http_session() -> requests.Session:
+    """ Shared HTTP session (connections are pooled & reused across requests) """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class APIHTTPException(Exception):
     def __init__(self, method: str, status_code: int, message: str, trace: str = ""):
         self.method = method
@@ -37,7 +50,7 @@ def post(url: str, debug: bool = False, **kwargs) -> requests.Response:
     if debug:
         console.print(f"POST {url}")
         console.print(kwargs)
-    return requests.post(url, **kwargs)
+    return http_session().post(url, **kwargs)
 
 
 def get(url: str, debug: bool = False, **kwargs) -> requests.Response:
@@ -45,4 +58,4 @@ def get(url: str, debug: bool = False, **kwargs) -> requests.Response:
     if debug:
         console.print(f"GET {url}")
         console.print(kwargs)
-    return requests.get(url, **kwargs)
+    return http_session().get(url, **kwargs)
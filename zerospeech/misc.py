@@ -38,11 +38,15 @@ try:
 except ImportError:
     tomli = None
 
+from .httpw import http_session
 from .out import with_progress, void_console, console
 from .settings import get_settings
 
 st = get_settings()
 
+# size of chunks used when streaming downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def exit_after(s):
     """ Decorator that kills function after s number of seconds
@@ -143,11 +147,15 @@ def load_obj(location: Path) -> Union[Dict, List]:
             raise ValueError('File of unknown format !!')
 
 
-def md5sum(file_path: Path, chunk_size: int = 8192):
+def md5sum(file_path: Path, chunk_size: int = 1024 * 1024):
     """ Return a md5 hash of a files content """
     h = MD5.new()
 
     with file_path.open('rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            # file is read once from start to end, allow aggressive readahead
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
         while True:
             chunk = f.read(chunk_size)
             if len(chunk):
@@ -202,16 +210,16 @@ def get_request_filename(response: requests.Response) -> str:
 
 def _download_file_requests(url: str, target: Path, size_in_bytes: int, *, show_progress: bool = True):
     """" Download a file from url using requests library """
-    response = requests.get(url, stream=True)
+    response = http_session().get(url, stream=True)
 
     with with_progress(show=show_progress, file_transfer=True) as progress:
         total = int(size_in_bytes)
         task1 = progress.add_task(f"[red]Downloading {target.name}...", total=total)
 
-        with target.open("wb") as stream:
-            for chunk in response.iter_content(chunk_size=1024):
+        with target.open("wb", buffering=_DOWNLOAD_CHUNK_SIZE) as stream:
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                 stream.write(chunk)
-                progress.update(task1, advance=1024)
+                progress.update(task1, advance=len(chunk))
         progress.update(task1, completed=total, visible=False)
 
 
@@ -327,7 +335,7 @@ def symlink_dir_contents(source: Path, dest: Path):
 
 def download_file(url: str, dest: Path):
     """ Download a file from a given URL """
-    response = requests.get(url, allow_redirects=True)
+    response = http_session().get(url, allow_redirects=True)
     with dest.open('wb') as fb:
         fb.write(response.content)
 
@@ -1,31 +1,55 @@
 import json
+import os
 import sys
 import warnings
 from datetime import datetime
+from typing import Dict
 
 from .settings import get_settings
 from .out import console, error_console
 from .generics import repository
+from .httpw import http_session
 
-import requests
 from pydantic import ValidationError
 
 st = get_settings()
 
 
+def _index_request_headers() -> Dict[str, str]:
+    """ Conditional request headers matching the local copy of the repository index """
+    if st.repository_index.is_file() and st.repository_index_etag.is_file():
+        return {'If-None-Match': st.repository_index_etag.read_text().strip()}
+    return {}
+
+
 def update_repo_index():
     """ Updates the repositories index from remote """
-    r = requests.get(st.repo_origin)
-    data = r.json()
+    r = http_session().get(st.repo_origin, headers=_index_request_headers())
+    if r.status_code == 304:
+        # local index is identical to the remote one
+        console.log("RepositoryIndex is already up to date !!")
+        return
+
+    raw = r.content
     try:
-        _ = repository.RepositoryIndex(**data)
+        _ = repository.RepositoryIndex.parse_raw(raw)
     except ValidationError:
         error_console.log(f"The given repository @ {st.repository_index} is not valid")
         error_console.log("Please contact the administrator to resolve this issue...")
         sys.exit(1)
 
-    with st.repository_index.open('w') as fp:
-        json.dump(data, fp, indent=4)
+    # write the validated payload as is, replacing the old index atomically
+    tmp_file = st.repository_index.with_suffix('.tmp')
+    tmp_file.write_bytes(raw)
+    os.replace(tmp_file, st.repository_index)
+
+    etag = r.headers.get('ETag', None)
+    if etag is not None:
+        st.repository_index_etag.write_text(etag)
+    else:
+        st.repository_index_etag.unlink(missing_ok=True)
+    # drop the cached (now outdated) index
+    repository.RepositoryIndex.load.cache_clear()
     console.log("RepositoryIndex has been updated successfully !!")
 
 
@@ -43,7 +67,10 @@ def check_update_repo_index() -> bool:
 
     # if
     try:
-        r = requests.get(st.repo_origin)
+        r = http_session().get(st.repo_origin, headers=_index_request_headers())
+        if r.status_code == 304:
+            # remote index has not changed since the last update
+            return False
         if r.status_code != 200:
             raise ValueError("Failed to find online repo")
         last_update_online = datetime.fromisoformat(r.json().get('last_modified'))
@@ -92,10 +92,44 @@ class DevNull(IO[str]):
         pass
 
 
-console = Console(log_time_format="[info]")
-warning_console = Console(stderr=True, style="bold yellow", log_time_format="[warning]")
-error_console = Console(stderr=True, style="bold red", log_time_format="[error]")
-void_console = Console(file=DevNull())
+class LazyConsole:
+    """ Proxy to a rich Console that is only created on first use
+
+    Creating a Console probes the terminal (size, color support, ...), the module level
+    consoles are proxied so that importing this module does not pay for consoles that
+    are never used.
+    """
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._console: Optional[Console] = None
+
+    @property
+    def console(self) -> Console:
+        """ The underlying rich Console """
+        if self._console is None:
+            self._console = Console(**self._kwargs)
+        return self._console
+
+    def __getattr__(self, name: str):
+        # private & dunder lookups are not forwarded (avoids recursing on _console
+        # when the proxy is copied or unpickled before being initialised)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.console, name)
+
+
+def as_console(con: Union[Console, LazyConsole]) -> Console:
+    """ Return a real rich Console (for rich components that require one) """
+    if isinstance(con, LazyConsole):
+        return con.console
+    return con
+
+
+console = LazyConsole(log_time_format="[info]")
+warning_console = LazyConsole(stderr=True, style="bold yellow", log_time_format="[warning]")
+error_console = LazyConsole(stderr=True, style="bold red", log_time_format="[error]")
+void_console = LazyConsole(file=DevNull())
 
 
 @contextlib.contextmanager
@@ -120,7 +154,7 @@ def with_progress(show: bool = True, file_transfer: bool = False, spinner: bool
         bar_items.append(SpinnerColumn())
 
     bar_items.append(TimeElapsedColumn())
-    progress = Progress(*bar_items, console=con, expand=True, transient=True)
+    progress = Progress(*bar_items, console=as_console(con), expand=True, transient=True)
 
     with progress:
         yield progress
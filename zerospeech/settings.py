@@ -7,14 +7,12 @@ from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
 from tempfile import gettempdir
-from typing import Dict, Tuple, Any, Optional, Union, Callable
+from typing import Dict, Tuple, Any, Optional, Union, Callable, Set
 
 from pydantic import (
     BaseSettings,
     AnyHttpUrl,
     parse_obj_as,
-    validator,
-    DirectoryPath,
     Field,
     EmailStr, BaseModel,
 )
@@ -23,6 +21,16 @@ StrOrCallable = Union[str, Callable[..., str]]
 
 API_URL = os.environ.get('_DEV_API_URL', 'https://api.cognitive-ml.fr')
 
+# temporary directories to remove on exit
+_TMP_DIRS: Set[Path] = set()
+
+
+@atexit.register
+def _clean_tmp_dirs():
+    """ Remove all auto-clean temporary directories """
+    for d in _TMP_DIRS:
+        shutil.rmtree(d, ignore_errors=True)
+
 
 class Token(BaseModel):
     """ Dataclass defining a session token"""
@@ -86,20 +94,14 @@ class ZerospeechAPI(BaseModel):
 
 class ZerospeechBenchmarkSettings(BaseSettings):
     APP_DIR: Path = Path.home() / "zr-data"
-    TMP_DIR: DirectoryPath = Path(gettempdir())
+    # only checked when creating temporary directories (see mkdtemp)
+    TMP_DIR: Path = Path(gettempdir())
     repo_origin: AnyHttpUrl = parse_obj_as(
         AnyHttpUrl, "https://download.zerospeech.com/repo.json"
     )
     admin_email: EmailStr = parse_obj_as(EmailStr, "nicolas.hamilakis@ens.psl.eu")
     api: ZerospeechAPI = ZerospeechAPI()
 
-    @validator("repo_origin", pre=True)
-    def cast_url(cls, v):
-        """ Cast strings to AnyHttpUrl """
-        if isinstance(v, str):
-            return parse_obj_as(AnyHttpUrl, v)
-        return v
-
     @property
     def dataset_path(self) -> Path:
         """ Path to dataset storage folder """
@@ -120,6 +122,11 @@ class ZerospeechBenchmarkSettings(BaseSettings):
         """ Path to local repository index """
         return self.APP_DIR / "repo.json"
 
+    @property
+    def repository_index_etag(self) -> Path:
+        """ Path to the ETag of the local repository index """
+        return self.APP_DIR / "repo.json.etag"
+
     @property
     def user_credentials(self):
         return self.APP_DIR / "creds.json"
@@ -132,14 +139,14 @@ class ZerospeechBenchmarkSettings(BaseSettings):
         )
 
     def mkdtemp(self, auto_clean: bool = True) -> Path:
-        tmp_loc = Path(tempfile.mkdtemp(prefix="zeroC", dir=self.TMP_DIR))
+        if not self.TMP_DIR.is_dir():
+            raise NotADirectoryError(f"TMP_DIR {self.TMP_DIR} is not a directory")
 
-        def clean_tmp(d):
-            shutil.rmtree(d)
+        tmp_loc = Path(tempfile.mkdtemp(prefix="zeroC", dir=self.TMP_DIR))
 
         if auto_clean:
-            # create an auto-clean action
-            atexit.register(clean_tmp, d=tmp_loc)
+            # removed at exit by _clean_tmp_dirs
+            _TMP_DIRS.add(tmp_loc)
 
         return tmp_loc
 
@@ -1,7 +1,9 @@
+import itertools
+import mmap
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union, Dict, ClassVar, Literal
+from typing import Optional, Union, Dict, ClassVar, Literal, get_args
 
 import yaml
 from pydantic import BaseModel, AnyUrl, ValidationError
@@ -14,6 +16,9 @@ BenchmarkList = Literal[
     "prosAudit", "sLM21", "abxLS", "abx17", "tde17",
     "test-prosAudit", "test-sLM21", "test-abxLS", "test-abx17", "test-tde17",
 ]
+_BENCHMARK_NAMES = frozenset(get_args(BenchmarkList))
+# top-level "benchmark_name: <name>" entry (optionally quoted)
+_BENCHMARK_NAME_RE = re.compile(rb'^benchmark_name:[ \t]*["\']?([\w-]+)["\']?[ \t]*(?:#.*)?\r?$', re.MULTILINE)
 
 
 def check_no_template(obj, root: str = "") -> ValidationContext:
@@ -241,15 +246,42 @@ class MetaFile(BaseModel):
         self.validation_context = validation
         return not validation.fails()
 
+    @classmethod
+    def _benchmark_name_fast(cls, meta_file: Path) -> Optional[BenchmarkList]:
+        """ Read the benchmark_name entry of a meta file without parsing the whole file
+
+        Returns None if the entry is not found exactly once as a plain top-level `key: value`
+        line (duplicated keys are resolved by the yaml parser) or if its value is not a known
+        benchmark. The other fields of the file are not validated.
+        """
+        try:
+            with meta_file.open('rb') as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                matches = list(itertools.islice(_BENCHMARK_NAME_RE.finditer(mm), 2))
+                # matches reference the map, extract the name before closing
+                name = matches[0].group(1).decode() if len(matches) == 1 else None
+        except (OSError, ValueError):
+            # missing file or empty file (which cannot be memory-mapped)
+            return None
+
+        if name not in _BENCHMARK_NAMES:
+            return None
+        return name
+
     @classmethod
     def benchmark_from_submission(cls, location: Path) -> Optional[BenchmarkList]:
         """ Extract the benchmark name from a given submission """
         meta_file = location / cls.file_stem
-        if not meta_file.is_file():
-            return None
+        benchmark_name = cls._benchmark_name_fast(meta_file)
+        if benchmark_name is not None:
+            return benchmark_name
 
-        with meta_file.open() as fp:
-            meta_obj = yaml.load(fp, Loader=yaml.FullLoader)
+        # fallback: parse & validate the whole file
+        try:
+            # open directly instead of checking the file first (one less stat)
+            with meta_file.open() as fp:
+                meta_obj = yaml.load(fp, Loader=yaml.FullLoader)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
         try:
             meta = cls.parse_obj(meta_obj)
             return meta.benchmark_name
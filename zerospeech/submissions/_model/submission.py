@@ -1,7 +1,7 @@
 import abc
 from functools import wraps
 from pathlib import Path
-from typing import List, Type, TYPE_CHECKING
+from typing import List, Type, Iterable, TYPE_CHECKING
 from typing import Optional, ClassVar
 
 from pydantic import BaseModel
@@ -45,21 +45,22 @@ def add_filename(filename: str, resp: List[ValidationResponse]):
         r.filename = filename
 
 
-def show_errors(resp: List[ValidationResponse], allow_warnings: bool = True):
+def show_errors(resp: Iterable[ValidationResponse], allow_warnings: bool = True):
     """ Print ValidationResponse Error (and warnings) """
-    error_list = [r for r in resp if not r.ok()]
-
-    if not allow_warnings:
-        error_list = [r for r in resp if not r.warning()]
-
-    for item in error_list:
-        if item.warning() and allow_warnings:
-            warning_console.log(item)
+    failed = False
+    for item in resp:
+        # errors only fail the validation
+        failed = failed or not item.valid()
+        if item.ok():
+            continue
+
+        if item.warning():
+            if allow_warnings:
+                warning_console.log(item)
         else:
             error_console.log(item)
 
-    # errors only fail the validation
-    return len([r for r in resp if not r.valid()]) != 0
+    return failed
 
 
 class SubmissionValidation(BaseModel, abc.ABC):
@@ -5,6 +5,12 @@ from typing import Optional, Dict, Any, Literal
 
 import yaml
 
+try:
+    # use libyaml emitter when available
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
 try:
     from zrc_abx2.eval_ABX import SEED
 except ImportError:
@@ -106,7 +112,8 @@ class ABX2Parameters(BenchmarkParameters):
     result_filename: str = "score_all_phonetic"
 
     def get_task(self):
-        return self.dict()
+        # all fields are flat values, a shallow copy skips the recursive .dict() conversion
+        return dict(self)
 
     def to_meta(self) -> Dict[str, Any]:
         """ Convert into leaderboard meta entry """
@@ -123,4 +130,4 @@ class ABX2Parameters(BenchmarkParameters):
         # see https://pydantic-docs.helpmanual.io/usage/types/#standard-library-types
         as_obj = json.loads(self.json(exclude=excluded))
         with file.open('w') as fp:
-            yaml.dump(as_obj, fp)
+            yaml.dump(as_obj, fp, Dumper=YamlDumper)
@@ -1,9 +1,10 @@
 from typing import Tuple, TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from .params import LexicalParams
-from zerospeech.data_loaders import load_dataframe
+from zerospeech.data_loaders import load_dataframe, csv_engine
 from zerospeech.generics import FileItem
 from zerospeech.tasks import Task
 
@@ -11,6 +12,10 @@ if TYPE_CHECKING:
     from zerospeech.submissions.sLM21 import SLM21Submission
     from zerospeech.datasets import SLM21Dataset
 
+# upper bounds (excluded) of the frequency bands used in eval_by_frequency
+_FREQUENCY_EDGES = np.array([1, 5, 20, 100])
+_FREQUENCY_BANDS = ['oov', '1-5', '6-20', '21-100', '>100']
+
 
 default_params = LexicalParams()
 
@@ -26,16 +31,16 @@ class LexicalTask(Task):
     @staticmethod
     def load_and_format(lexical_item: FileItem, gold_item: FileItem):
         """ Loads & formats submission data and gold data """
-        gold_values = load_dataframe(gold_item, header=0, index_col='filename').astype(
-            {'frequency': pd.Int64Dtype()})
+        gold_values = load_dataframe(
+            gold_item, header=0, engine=csv_engine(),
+            dtype={'frequency': 'Int64', 'correct': 'int8', 'length': 'int16'})
 
-        lexical_values = load_dataframe(lexical_item, sep=' ', header=None,
-                                        names=['filename', 'score'], index_col='filename')
+        lexical_values = load_dataframe(lexical_item, sep=' ', header=None, engine=csv_engine(),
+                                        names=['filename', 'score'])
 
         # merge the gold and score using filenames, then remove the columns
         # 'phones' and 'filename' as we don't use them for evaluation
         data = pd.merge(gold_values, lexical_values, on='filename', how='inner')
-        data.reset_index(inplace=True)
 
         # if all non-words have their textual version set to NaN, we take their phonemic version instead.
         if data[data.correct == 0]['word'].isnull().sum() == len(data[data.correct == 0]):
@@ -43,20 +48,17 @@ class LexicalTask(Task):
         data.drop(columns=['phones', 'filename'], inplace=True)
 
         # going from a word per line to a pair (word, non word) per line
-        words = data.loc[data['correct'] == 1].reset_index().rename(lambda x: 'w_' + x, axis=1)
-        non_words = data.loc[data['correct'] == 0].reset_index().rename(lambda x: 'nw_' + x, axis=1)
-        data = pd.merge(words, non_words, left_on=['w_voice', 'w_id'], right_on=['nw_voice', 'nw_id'])
-
-        data.drop(
-            ['w_index', 'nw_index', 'nw_voice', 'nw_frequency',
-             'w_correct', 'nw_correct', 'nw_id', 'nw_length'],
-            axis=1, inplace=True)
-        data.rename(
-            {'w_id': 'id', 'w_voice': 'voice', 'w_frequency': 'frequency',
-             'w_word': 'word', 'nw_word': 'non word', 'w_length': 'length',
-             'w_score': 'score word', 'nw_score': 'score non word'},
-            axis=1, inplace=True)
-        return data
+        pairs = data.set_index(['voice', 'id', 'correct']).unstack('correct')
+        # only keep complete (word, non word) pairs
+        pairs = pairs[pairs['length'].notna().all(axis=1)]
+        return pd.DataFrame({
+            'frequency': pairs['frequency', 1],
+            'word': pairs['word', 1],
+            'length': pairs['length', 1].astype(data['length'].dtype),
+            'score word': pairs['score', 1],
+            'non word': pairs['word', 0],
+            'score non word': pairs['score', 0],
+        }).reset_index()
 
     @staticmethod
     def eval_by_pair(data: pd.DataFrame) -> pd.DataFrame:
@@ -76,22 +78,21 @@ class LexicalTask(Task):
             """
         # compute the score for each pair in an additional 'score' column, then
         # delete the 'score word' and 'score non word' columns that become useless
-        score = data.loc[:, ['score word', 'score non word']].to_numpy()
-        data['score'] = (
-                0.5 * (score[:, 0] == score[:, 1])
-                + (score[:, 0] > score[:, 1]))
+        score_word = data['score word'].to_numpy()
+        score_non_word = data['score non word'].to_numpy()
+        data['score'] = np.where(
+            score_word > score_non_word, 1.0,
+            np.where(score_word == score_non_word, 0.5, 0.0))
         data.drop(columns=['score word', 'score non word'], inplace=True)
 
         # finally get the mean score across voices for all pairs
-        score = data.groupby('id').apply(lambda x: (
-            x.iat[0, 3],  # word
-            x.iat[0, 5],  # non word
-            x.iat[0, 2],  # frequency
-            x.iat[0, 4],  # length
-            x['score'].mean()))
-        return pd.DataFrame(
-            score.to_list(),
-            columns=['word', 'non word', 'frequency', 'length', 'score'])
+        return data.groupby('id').agg(
+            word=('word', 'first'),
+            non_word=('non word', 'first'),
+            frequency=('frequency', 'first'),
+            length=('length', 'first'),
+            score=('score', 'mean')
+        ).rename(columns={'non_word': 'non word'}).reset_index(drop=True)
 
     @staticmethod
     def eval_by_frequency(data: pd.DataFrame) -> pd.DataFrame:
@@ -113,13 +114,16 @@ class LexicalTask(Task):
                 following columns: 'frequency', 'score'.
 
             """
-        bands = pd.cut(
-            data.frequency,
-            [0, 1, 5, 20, 100, float('inf')],
-            labels=['oov', '1-5', '6-20', '21-100', '>100'],
-            right=False)
-
-        return data.score.groupby(bands).agg(
+        # band of each word as in [0, 1, 5, 20, 100, inf) (right-open intervals)
+        frequency = data.frequency.to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = np.searchsorted(_FREQUENCY_EDGES, frequency, side='right')
+        # values outside of all bands (NaN, negative or infinite) are left out
+        codes[~((frequency >= 0) & (frequency < np.inf))] = -1
+        bands = pd.Series(
+            pd.Categorical.from_codes(codes, categories=_FREQUENCY_BANDS, ordered=True),
+            index=data.index, name=data.frequency.name)
+
+        return data.score.groupby(bands, observed=False).agg(
             n='count', score='mean', std='std').reset_index()
 
     @staticmethod
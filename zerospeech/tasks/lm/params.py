@@ -1,10 +1,8 @@
 import enum
-import functools
 import json
 from pathlib import Path
 from typing import Any, Dict, Literal
 
-import numpy as np
 import yaml
 from pydantic import BaseModel
 
@@ -22,6 +20,18 @@ _SciPyMetrics = ['braycurtis', 'canberra', 'chebyshev', 'cityblock', 'correlatio
 SemanticMetrics = enum.Enum('SemanticMetrics', {f"{k}": k for k in _SciPyMetrics})
 
 
+# pooling functions (using ndarray methods to skip the numpy wrappers)
+_POOL_FNS = {
+    'max': lambda x: x.max(axis=0),
+    'min': lambda x: x.min(axis=0),
+    'mean': lambda x: x.mean(axis=0),
+    'sum': lambda x: x.sum(axis=0),
+    'last': lambda x: x[-1],
+    'lastlast': lambda x: x[-2],
+    'off': lambda x: x,
+}
+
+
 class SemanticPooling(str, enum.Enum):
     min = 'min'
     max = 'max'
@@ -33,24 +43,7 @@ class SemanticPooling(str, enum.Enum):
 
     @property
     def fn(self):
-        if self == self.max:
-            return functools.partial(np.max, axis=0)
-        elif self == self.min:
-            return functools.partial(np.min, axis=0)
-        elif self == self.mean:
-            return functools.partial(np.mean, axis=0)
-        elif self == self.sum:
-            return functools.partial(np.sum, axis=0)
-        elif self == self.last:
-            return lambda x: x[-1]
-        elif self == self.lastlast:
-            return lambda x: x[-2]
-        elif self == self.off:
-            return lambda x: x
-        else:
-            raise ValueError(
-                f'pooling method must be {",".join([f.value for f in self])}' # noqa: enum typing is bad
-            )
+        return _POOL_FNS[self.value]
 
 
 class SemanticParams(BaseModel):
@@ -1,16 +1,16 @@
 from pathlib import Path
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import joblib
 import numpy as np
 import pandas as pd
-import scipy.spatial
 import scipy.stats
 
-from zerospeech.data_loaders import load_dataframe, load_numpy_array
+from zerospeech.data_loaders import load_dataframe, load_numpy_array, csv_engine
 from zerospeech.generics import FileItem, FileListItem
 from zerospeech.tasks import Task
 from .params import SemanticParams, SemanticMetrics, SemanticPooling
+from .vector_operations import distance_matrix, paired_distances
 
 if TYPE_CHECKING:
     from zerospeech.submissions.sLM21 import SLM21Submission
@@ -18,6 +18,16 @@ if TYPE_CHECKING:
 
 default_params = SemanticParams()
 
+# (type, word) -> (voices, stacked pooled vectors)
+EmbeddingsIndex = Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]]
+
+
+def _compute_pooling(type_: str, filename: str, fname: Optional[Path], pooling: SemanticPooling):
+    """ Compute pooling from submission array """
+    if fname is None:
+        return filename, type_, None
+    return filename, type_, pooling.fn(load_numpy_array(fname))
+
 
 class SemanticTask(Task):
     _name = "semantic"
@@ -49,37 +59,56 @@ class SemanticTask(Task):
         # transform raw result in a usable dataframe
         return series.to_frame().rename(columns={0: 'correlation'}).reset_index()
 
-    def compute_distance(self, pairs_row: pd.Series, gold_df: pd.DataFrame, pool: pd.DataFrame):
-        # keep only current type in gold
-        gold_df = gold_df[gold_df['type'] == pairs_row['type']]
-
-        if pairs_row['type'] == 'librispeech':
-            # get the list of tokens corresponding to the given pair of words
-            tokens_1 = gold_df['filename'][gold_df['word'] == pairs_row['word_1']]
-            tokens_2 = gold_df['filename'][gold_df['word'] == pairs_row['word_2']]
-            assert 0 < len(tokens_1) <= 10 and 0 < len(tokens_2) <= 10
+    def compute_distance(self, type_: str, word_1: str, word_2: str, embeddings: EmbeddingsIndex):
+        """ Compute the mean distance between the tokens of a pair of words """
+        voices_1, x = embeddings[(type_, word_1)]
+        voices_2, y = embeddings[(type_, word_2)]
 
-            x = np.asarray(pool[pool['filename'].isin(tokens_1)]['pooling'].tolist())
-            y = np.asarray(pool[pool['filename'].isin(tokens_2)]['pooling'].tolist())
+        if type_ == 'librispeech':
+            assert 0 < len(x) <= 10 and 0 < len(y) <= 10
 
             # compute the mean distance across all pairs of tokens after pooling
-            return scipy.spatial.distance.cdist(  # noqa: bad __init__ for scipy.spatial ??
-                x, y, metric=str(self.metric.value)).mean()
-        elif pairs_row['type'] == 'synthetic':
-            # get the list of tokens corresponding to the given pair of words
-            tokens_1 = gold_df[['filename', 'voice']][gold_df['word'] == pairs_row['word_1']]
-            tokens_2 = gold_df[['filename', 'voice']][gold_df['word'] == pairs_row['word_2']]
-            tokens = tokens_1.merge(tokens_2, on='voice').drop(['voice'], axis=1)
+            return distance_matrix(x, y, metric=str(self.metric.value)).mean()
+        elif type_ == 'synthetic':
+            # align the tokens of both words on their common voices
+            _, idx_1, idx_2 = np.intersect1d(voices_1, voices_2, assume_unique=True, return_indices=True)
 
             # compute the mean of distances within a given voice
-            dist = 0
-            for _, (filename_x, filename_y) in tokens.iterrows():
-                x = pool[pool['filename'] == filename_x]['pooling'].item()
-                y = pool[pool['filename'] == filename_y]['pooling'].item()
-                dist += scipy.spatial.distance.cdist(  # noqa: bad __init__ for scipy.spatial ??
-                    np.atleast_2d(x), np.atleast_2d(y), metric=str(self.metric.value))[0][0]
-
-            return dist / len(tokens)
+            return paired_distances(x[idx_1], y[idx_2], metric=str(self.metric.value)).mean()
+
+    @staticmethod
+    def stack_pooling(pooling_results: List[Tuple[str, str, Optional[np.ndarray]]]) -> Tuple[np.ndarray, Dict[str, int]]:
+        """ Copy the pooled vectors into a single float32 matrix
+
+        Returns the matrix (one row per file) & a dictionary mapping each filename to its row,
+        files missing from the submission are left out.
+        """
+        pooled = [(filename, vec) for filename, _, vec in pooling_results if vec is not None]
+        if len(pooled) == 0:
+            return np.empty((0, 0), dtype=np.float32), {}
+
+        mat = np.empty((len(pooled), pooled[0][1].shape[-1]), dtype=np.float32)
+        idx_of = {}
+        for i, (filename, vec) in enumerate(pooled):
+            mat[i] = vec.astype(np.float32, copy=False)
+            idx_of[filename] = i
+        return mat, idx_of
+
+    @staticmethod
+    def build_embeddings(gold_df: pd.DataFrame, mat: np.ndarray, idx_of: Dict[str, int]) -> EmbeddingsIndex:
+        """ Gather the pooled vectors of each (type, word) into a single matrix
+
+        Returns a dictionary indexed by (type, word) containing the voices of the tokens
+        and a matrix of their pooled vectors (one row per token).
+        """
+        tokens_by_word = gold_df.groupby(['type', 'word'], sort=False)[['filename', 'voice']].agg(list)
+        return {
+            (_type, word): (
+                np.asarray(voices),
+                mat[np.fromiter((idx_of[f] for f in filenames), dtype=np.intp, count=len(filenames))]
+            )
+            for (_type, word), filenames, voices in tokens_by_word.itertuples(name=None)
+        }
 
     def build_file_index(
             self, synthetic: FileListItem, librispeech: FileListItem
@@ -101,8 +130,8 @@ class SemanticTask(Task):
     def semantic_eval(self, file_index: Dict[str, Dict[str, Path]],
                       gold: FileItem, pairs: FileItem):
         """ Semantically evaluate a subset """
-        pairs_df = load_dataframe(pairs, header=0)
-        gold_df = load_dataframe(gold, header=0)
+        pairs_df = load_dataframe(pairs, header=0, engine=csv_engine())
+        gold_df = load_dataframe(gold, header=0, engine=csv_engine())
 
         if not self.synthetic:
             gold_df = gold_df.drop(gold_df[gold_df['type'] == 'synthetic'].index)
@@ -112,23 +141,21 @@ class SemanticTask(Task):
             gold_df = gold_df.drop(gold_df[gold_df['type'] == 'librispeech'].index)
             pairs_df = pairs_df.drop(pairs_df[pairs_df['type'] == 'librispeech'].index)
 
-        def compute(_row: pd.Series):
-            """ Compute pooling from submission array """
-            fname = file_index.get(_row[0], {}).get(_row[1], None)
-            if fname is None:
-                return _row[1], _row[0], None
-            data = load_numpy_array(fname)
-            # values
-            return _row[1], _row[0], self.pooling.fn(data)
-
-        # compute pooling from g
-        res = joblib.Parallel(n_jobs=self.n_jobs)(joblib.delayed(compute)(x) for _, x in gold_df.iterrows())
-        pool = pd.DataFrame(res, columns=['filename', 'type', 'pooling'])
-
-        pairs_df['score'] = [
-            self.compute_distance(pairs_row, gold_df, pool)
-            for _, pairs_row in pairs_df.iterrows()
-        ]
+        # compute pooling from gold
+        res = joblib.Parallel(n_jobs=self.n_jobs, batch_size=64)(
+            joblib.delayed(_compute_pooling)(
+                type_, filename, file_index.get(type_, {}).get(filename, None), self.pooling
+            )
+            for type_, filename in gold_df[['type', 'filename']].to_numpy()
+        )
+        mat, idx_of = self.stack_pooling(res)
+        embeddings = self.build_embeddings(gold_df, mat, idx_of)
+
+        # score pairs (threads avoid copying the embeddings to each worker)
+        pairs_df['score'] = joblib.Parallel(n_jobs=self.n_jobs, prefer='threads')(
+            joblib.delayed(self.compute_distance)(type_, word_1, word_2, embeddings)
+            for type_, word_1, word_2 in pairs_df[['type', 'word_1', 'word_2']].itertuples(index=False, name=None)
+        )
 
         correlation = self.compute_correlation(pairs_df)
 
@@ -0,0 +1,131 @@
+""" Distance kernels used by the semantic evaluation """
+import functools
+import math
+from typing import Callable, Optional
+
+import numpy as np
+import scipy.spatial
+
+# below this number of pairs, loading numba & its kernels costs more than they save
+_NUMBA_MIN_PAIRS = 64 * 64
+
+
+def cosine_distance_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Compute the cosine distance between each pair of rows of a & b """
+    norm_a = np.empty(a.shape[0], dtype=np.float64)
+    norm_b = np.empty(b.shape[0], dtype=np.float64)
+    for i in range(a.shape[0]):
+        acc = 0.0
+        for k in range(a.shape[1]):
+            acc += a[i, k] * a[i, k]
+        norm_a[i] = math.sqrt(acc)
+    for j in range(b.shape[0]):
+        acc = 0.0
+        for k in range(b.shape[1]):
+            acc += b[j, k] * b[j, k]
+        norm_b[j] = math.sqrt(acc)
+
+    out = np.empty((a.shape[0], b.shape[0]), dtype=np.float64)
+    for i in range(a.shape[0]):
+        for j in range(b.shape[0]):
+            acc = 0.0
+            for k in range(a.shape[1]):
+                acc += a[i, k] * b[j, k]
+            out[i, j] = 1.0 - acc / (norm_a[i] * norm_b[j])
+    return out
+
+
+def euclidean_distance_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Compute the euclidean distance between each pair of rows of a & b """
+    out = np.empty((a.shape[0], b.shape[0]), dtype=np.float64)
+    for i in range(a.shape[0]):
+        for j in range(b.shape[0]):
+            acc = 0.0
+            for k in range(a.shape[1]):
+                diff = a[i, k] - b[j, k]
+                acc += diff * diff
+            out[i, j] = math.sqrt(acc)
+    return out
+
+
+def cityblock_distance_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Compute the manhattan distance between each pair of rows of a & b """
+    out = np.empty((a.shape[0], b.shape[0]), dtype=np.float64)
+    for i in range(a.shape[0]):
+        for j in range(b.shape[0]):
+            acc = 0.0
+            for k in range(a.shape[1]):
+                acc += abs(a[i, k] - b[j, k])
+            out[i, j] = acc
+    return out
+
+
+_KERNELS = {
+    'cosine': cosine_distance_matrix,
+    'euclidean': euclidean_distance_matrix,
+    'cityblock': cityblock_distance_matrix,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernel(metric: str) -> Optional[Callable]:
+    """ Compile the kernel of a metric using numba (None if numba or the kernel is missing)
+
+    Kernels are compiled without numba's parallel mode & release the GIL, as
+    parallelism is handled by the caller (the semantic task scores pairs in threads).
+    Compiled kernels are cached on disk to avoid compiling them on each run.
+    """
+    kernel = _KERNELS.get(metric, None)
+    if kernel is None:
+        return None
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(nogil=True, fastmath=True, cache=True)(kernel)
+
+
+def distance_matrix(a: np.ndarray, b: np.ndarray, metric: str) -> np.ndarray:
+    """ Compute the distance between each pair of rows of a & b
+
+    Large matrices of common metrics use a numba kernel when numba is installed,
+    all the others fall back on scipy's cdist.
+    """
+    kernel = None
+    if a.shape[0] * b.shape[0] >= _NUMBA_MIN_PAIRS:
+        kernel = _numba_kernel(metric)
+    if kernel is None:
+        return scipy.spatial.distance.cdist(a, b, metric=metric)  # noqa: bad __init__ for scipy.spatial ??
+
+    # kernels expect contiguous arrays of the same dtype, float32 vectors are read as is
+    # but distances are always accumulated in float64 (same precision as cdist)
+    dtype = np.result_type(a, b)
+    if dtype != np.float32:
+        dtype = np.float64
+    return kernel(
+        np.ascontiguousarray(a, dtype=dtype),
+        np.ascontiguousarray(b, dtype=dtype)
+    )
+
+
+def _paired_cosine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return 1.0 - np.einsum('ij,ij->i', a, b) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+
+
+_PAIRED_KERNELS = {
+    'cosine': _paired_cosine,
+    'euclidean': lambda a, b: np.linalg.norm(a - b, axis=1),
+    'cityblock': lambda a, b: np.abs(a - b).sum(axis=1),
+}
+
+
+def paired_distances(a: np.ndarray, b: np.ndarray, metric: str) -> np.ndarray:
+    """ Compute the distance between each row of a & the matching row of b
+
+    Equivalent to the diagonal of distance_matrix(a, b) without computing the
+    off-diagonal terms (other metrics fall back on the full matrix).
+    """
+    kernel = _PAIRED_KERNELS.get(metric, None)
+    if kernel is None:
+        return distance_matrix(a, b, metric=metric).diagonal()
+    return kernel(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
@@ -5,11 +5,10 @@ from pathlib import Path
 from typing import Tuple, Optional, Any, Union, Dict, TYPE_CHECKING
 
 from pydantic import BaseModel
-from rich.console import Console
 
 from zerospeech.benchmarks import BenchmarkList
 from zerospeech.data_loaders import zip_zippable
-from zerospeech.out import void_console, console as std_console, error_console
+from zerospeech.out import void_console, console as std_console, error_console, LazyConsole
 from zerospeech.settings import get_settings
 from zerospeech.httpw import post as http_post, get as http_get, APIHTTPException
 from zerospeech.misc import ScoresNotFound, MetaYamlNotValid, InvalidSubmissionError
@@ -251,7 +250,7 @@ class SubmissionUploader:
         self.console.print(f"\t MODEL_ID: {self._manifest.model_id}", style="dark_orange3 italic")
 
     @property
-    def console(self) -> Console:
+    def console(self) -> LazyConsole:
         if self._quiet:
             return void_console
         return std_console
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Callable, Any, Type
+from typing import List, Callable, Any, Type, Iterable
 
 import numpy as np
 import pandas as pd
@@ -12,44 +12,34 @@ BASE_VALIDATOR_FN_TYPE = Callable[[Any], List[ValidationResponse]]
 return_type = List[ValidationResponse]
 
 
-def list_checker(given: List[str], expected: List[str]) -> return_type:
+def list_checker(given: Iterable[str], expected: Iterable[str]) -> return_type:
     """ Check a list of strings to find if expected items are in it """
-    given = set(given)
-    expected = set(expected)
-
-    if given != expected:
-        has_less_files = expected - given
-        has_more_files = given - expected
-        res = []
-
-        if len(has_more_files) > 0:
-
-            for e_file in has_more_files:
-                res.append(
-                    ValidationError(
-                        "extra file found",
-                        filename=e_file
-                    )
-                )
-        elif len(has_less_files) > 0:
-            res = []
-            for e_file in has_less_files:
-                res.append(ValidationError(
-                    "expected file not found",
-                    filename=e_file
-                ))
-
-        return res
-    else:
+    given = frozenset(given)
+    expected = frozenset(expected)
+
+    if given == expected:
         return [ValidationOK('expected files found')]
 
+    # extra files are reported first, missing files only when there are none
+    has_more_files = given - expected
+    if len(has_more_files) > 0:
+        return [
+            ValidationError("extra file found", filename=e_file)
+            for e_file in has_more_files
+        ]
+
+    return [
+        ValidationError("expected file not found", filename=e_file)
+        for e_file in expected - given
+    ]
+
 
 def file_list_checker(
         item: FileListItem, expected: List[Path]
 ) -> return_type:
     """ Check if a file list has expected files in it (ignoring file suffix) """
-    file_names = [f.stem for f in item.files_list]
-    expected_names = [f.stem for f in expected]
+    file_names = (f.stem for f in item.files_list)
+    expected_names = (f.stem for f in expected)
     return list_checker(given=file_names, expected=expected_names)
 
 
@@ -57,7 +47,7 @@ def file_list_stem_check(
         item: FileListItem, expected: List[str]
 ) -> return_type:
     """ Check if a file list has expected filenames in it (ignoring file suffix)"""
-    file_names = [f.stem for f in item.files_list]
+    file_names = (f.stem for f in item.files_list)
     return list_checker(given=file_names, expected=expected)
 
 
@@ -75,8 +65,7 @@ def dataframe_column_check(df: pd.DataFrame, expected_columns: List[str]) -> ret
 def dataframe_index_check(df: pd.DataFrame, expected: List[str]) -> return_type:
     """ Check that specific values are contained in each row"""
     # check if all files from the dataset are represented in the filenames
-    index = list(df.index)
-    return list_checker(index, expected)
+    return list_checker(df.index, expected)
 
 
 def dataframe_type_check(df: pd.DataFrame, col_name: str, expected_type: Type[Any]) -> return_type: